@@ -5,3 +5,8 @@ env.read_env()
 
 API_PORT = env.str("API_PORT")
 SELENOID_COMMAND_EXECUTOR = env.str("SELENOID_COMMAND_EXECUTOR")
+POOL_SIZE = env.int("POOL_SIZE", 4)
+MAX_SCRAPER_WORKERS = env.int("MAX_SCRAPER_WORKERS", POOL_SIZE)
+IMITATE_USER = env.bool("IMITATE_USER", False)
+PAGE_LOAD_TIMEOUT = env.int("PAGE_LOAD_TIMEOUT", 20)
+MAX_USES_PER_INSTANCE = env.int("MAX_USES_PER_INSTANCE", 100)
@@ -1,6 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import FastAPI
 
+import pool
 import routers
+from config import POOL_SIZE
+from scraper import SelenoidWebScraper
 
 # FastAPI Application
 app = FastAPI(
@@ -18,9 +24,19 @@ app.include_router(routers.router)
 @app.on_event("startup")
 async def startup_event() -> None:
     print("Startup!")
+    # Blocking Selenium calls run here; one worker per pooled driver plus
+    # headroom for pool maintenance.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=POOL_SIZE * 2)
+    )
+    scraper = SelenoidWebScraper()
+    pool.browser_pool = pool.BrowserPool(factory=scraper.start)
+    await pool.browser_pool.open()
 
 
 # Event: On Shutdown
 @app.on_event("shutdown")
 async def shutdown_event():
     print("Shutdown!")
+    if pool.browser_pool is not None:
+        await pool.browser_pool.close()
@@ -0,0 +1,228 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    WebDriverException,
+)
+
+from config import MAX_USES_PER_INSTANCE, POOL_SIZE
+
+# Delay between relaunch attempts when Selenoid refuses a new session.
+_RELAUNCH_RETRY_DELAY = 5
+
+
+class BrowserPool:
+    """
+    Fixed-size pool of remote Firefox web drivers shared by all scrape requests.
+
+    Drivers are launched once at application startup and checked out per
+    request, so the per-request browser boot cost disappears. Each driver is
+    recycled (quit and relaunched) after `max_uses` checkouts to avoid
+    long-lived session degradation.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[webdriver.Remote]],
+        size: int = POOL_SIZE,
+        max_uses: int = MAX_USES_PER_INSTANCE,
+    ) -> None:
+        """
+        :param factory: Coroutine function that builds a ready-to-use remote web driver.
+        :param size: Number of drivers kept alive in the pool.
+        :param max_uses: Checkouts after which a driver is quit and relaunched.
+        """
+        self._factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._use_counts: Dict[str, int] = {}
+        self._broken: set = set()
+        self._recycled = 0
+        self._in_use = 0
+        self._closed = False
+        self._relaunch_tasks: set = set()
+
+    async def open(self) -> None:
+        """
+        Launch `size` drivers and make them available for checkout.
+        """
+        for _ in range(self.size):
+            driver = await self._factory()
+            self._use_counts[driver.session_id] = 0
+            self._queue.put_nowait(driver)
+
+        print(f"Browser pool started with {self.size} drivers.")
+
+    async def close(self) -> None:
+        """
+        Quit every pooled driver. Drivers currently checked out are not
+        waited for; they are quit by their release.
+        """
+        self._closed = True
+
+        for task in self._relaunch_tasks:
+            task.cancel()
+
+        while not self._queue.empty():
+            driver = self._queue.get_nowait()
+            await self._quit(driver)
+
+        self._use_counts.clear()
+        print("Browser pool stopped.")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[webdriver.Remote]:
+        """
+        Check a driver out of the pool and return it when the block exits.
+
+        :return: Async context manager yielding a remote web driver.
+        """
+        driver = await self._queue.get()
+        self._in_use += 1
+
+        try:
+            yield driver
+        finally:
+            self._in_use -= 1
+            await self._release(driver)
+
+    async def _release(self, driver: webdriver.Remote) -> None:
+        """
+        Return a driver to the pool, recycling it if it reached `max_uses`
+        or cleaning its session state otherwise.
+
+        :param driver: Driver previously checked out via `acquire`.
+        """
+        if self._closed:
+            self._use_counts.pop(driver.session_id, None)
+            await self._quit(driver)
+            return
+
+        uses = self._use_counts.get(driver.session_id, 0) + 1
+        self._use_counts[driver.session_id] = uses
+
+        if driver.session_id in self._broken:
+            self._broken.discard(driver.session_id)
+            driver = await self._recycle(driver)
+
+        elif uses >= self.max_uses:
+            driver = await self._recycle(driver)
+
+        else:
+            try:
+                # Isolate consecutive uses without paying for a new session.
+                await asyncio.to_thread(driver.delete_all_cookies)
+                await asyncio.to_thread(driver.get, "about:blank")
+            except (WebDriverException, InvalidSessionIdException) as ex:
+                print(f"Driver cleanup failed, recycling it: {ex}")
+                driver = await self._recycle(driver)
+
+        # A failed relaunch returns no driver; the slot is refilled by the
+        # background task _recycle spawned instead.
+        if driver is not None:
+            self._queue.put_nowait(driver)
+
+    def mark_broken(self, driver: webdriver.Remote) -> None:
+        """
+        Flag a checked-out driver whose session is unusable, so its release
+        recycles it instead of returning it to rotation.
+
+        :param driver: Driver currently checked out via `acquire`.
+        """
+        self._broken.add(driver.session_id)
+
+    async def _recycle(self, driver: webdriver.Remote) -> Optional[webdriver.Remote]:
+        """
+        Quit a worn-out driver and launch a replacement.
+
+        If the relaunch fails (e.g. Selenoid is momentarily unreachable),
+        the slot is not lost: a background task keeps retrying and returns
+        the replacement to the queue once it succeeds.
+
+        :param driver: Driver to be replaced.
+        :return: Freshly launched driver, or None if the relaunch was deferred.
+        """
+        self._use_counts.pop(driver.session_id, None)
+        await self._quit(driver)
+
+        try:
+            replacement = await self._factory()
+        except Exception as ex:
+            print(f"Driver relaunch failed, retrying in background: {ex}")
+            task = asyncio.get_running_loop().create_task(self._relaunch_slot())
+            self._relaunch_tasks.add(task)
+            task.add_done_callback(self._relaunch_tasks.discard)
+            return None
+
+        self._use_counts[replacement.session_id] = 0
+        self._recycled += 1
+        return replacement
+
+    async def _relaunch_slot(self) -> None:
+        """
+        Keep retrying driver creation until it succeeds, then return the
+        slot to the pool.
+        """
+        while not self._closed:
+            await asyncio.sleep(_RELAUNCH_RETRY_DELAY)
+
+            try:
+                replacement = await self._factory()
+            except Exception as ex:
+                print(
+                    f"Driver relaunch failed, retrying in {_RELAUNCH_RETRY_DELAY}s: {ex}"
+                )
+                continue
+
+            if self._closed:
+                await self._quit(replacement)
+                return
+
+            self._use_counts[replacement.session_id] = 0
+            self._recycled += 1
+            self._queue.put_nowait(replacement)
+            return
+
+    @staticmethod
+    async def _quit(driver: webdriver.Remote) -> None:
+        """
+        Quit a driver, tolerating sessions that are already gone.
+
+        :param driver: Driver to quit.
+        """
+        try:
+            await asyncio.to_thread(driver.quit)
+        except (WebDriverException, InvalidSessionIdException):
+            print("Browser session was not found. It might have been closed already.")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the pool state for the `/metrics` route.
+        """
+        return {
+            "size": self.size,
+            "available": self._queue.qsize(),
+            "in_use": self._in_use,
+            "recycled": self._recycled,
+            "use_counts": dict(self._use_counts),
+        }
+
+
+# Shared pool instance, created by the application startup event.
+browser_pool: Optional[BrowserPool] = None
+
+
+def get_pool() -> BrowserPool:
+    """
+    Return the shared browser pool.
+
+    :return: The pool created at application startup.
+    """
+    if browser_pool is None:
+        raise RuntimeError("Browser pool is not initialized.")
+
+    return browser_pool
@@ -1,15 +1,49 @@
+import asyncio
 from typing import Any, Dict
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
+from config import MAX_SCRAPER_WORKERS
+from pool import get_pool
 from scraper import SelenoidWebScraper
 
 router = APIRouter(tags=["main"], prefix="/api/v1.0")
 
+# Bound concurrent scrapes so bursts queue on the semaphore instead of
+# piling up on the browser pool and timing out en masse.
+_SCRAPER_SEM = asyncio.Semaphore(MAX_SCRAPER_WORKERS)
+# Beyond this many queued requests, shed load instead of queueing further.
+_MAX_WAITING = MAX_SCRAPER_WORKERS * 2
+_waiting = 0
+
 
 @router.get("")
 async def greeting() -> Dict[str, Any]:
+    global _waiting
+
     print("Greeting endpoint accessed")
-    scraper = SelenoidWebScraper()
-    scraper.scrape("https://www.pravda.com.ua/rus/news/2023/11/23/7430013/")
+
+    if _SCRAPER_SEM.locked() and _waiting >= _MAX_WAITING:
+        raise HTTPException(
+            status_code=503,
+            detail="Scraper is at capacity. Please retry later.",
+            headers={"Retry-After": "5"},
+        )
+
+    _waiting += 1
+
+    try:
+        async with _SCRAPER_SEM:
+            scraper = SelenoidWebScraper()
+            await scraper.scrape(
+                "https://www.pravda.com.ua/rus/news/2023/11/23/7430013/"
+            )
+    finally:
+        _waiting -= 1
+
     return {"HI!": "I`m ScraperAPI and I am working with Selenoid!"}
+
+
+@router.get("/metrics")
+async def metrics() -> Dict[str, Any]:
+    return get_pool().stats()
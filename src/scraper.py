@@ -1,20 +1,36 @@
-import itertools
+import asyncio
+import copy
+import functools
+import logging
 import random
-import time
-from typing import Any, Callable, Iterable, List, Optional
+import re
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, ClassVar, Optional, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 from selenium import webdriver
 from selenium.common.exceptions import (
     InvalidSessionIdException,
     TimeoutException,
     WebDriverException,
 )
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 
-from config import SELENOID_COMMAND_EXECUTOR
+from config import (
+    IMITATE_USER,
+    PAGE_LOAD_TIMEOUT,
+    POOL_SIZE,
+    SELENOID_COMMAND_EXECUTOR,
+)
+from pool import get_pool
+
+# Selenium logs every WebDriver command and urllib3 every connection at
+# DEBUG; formatting those records costs allocations on each command.
+logging.getLogger("selenium").setLevel(logging.WARNING)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
 
-_USER_AGENTS: List[str] = [
+_USER_AGENTS: Tuple[str, ...] = (
     # Firefox/115.0
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7; rv:115.0) Gecko/20000101 Firefox/115.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 13.5; rv:109.0) Gecko/20100101 Firefox/115.0",
@@ -24,13 +40,251 @@ _USER_AGENTS: List[str] = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 11_5_2; rv:115.0) Gecko/20100101 Firefox/115.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 11_2; rv:115.0) Gecko/20110101 Firefox/115.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7; rv:115.0) Gecko/20000101 Firefox/115.0",
-]
+)
+
+
+class _PooledRemoteConnection(RemoteConnection):
+    """
+    RemoteConnection whose urllib3 pool allows concurrent WebDriver commands.
+
+    The default connection manager keeps `maxsize=1` per host, so parallel
+    commands from the pooled drivers against the same Selenoid host would
+    serialize on the transport.
+    """
+
+    _POOL_MAXSIZE = POOL_SIZE * 2
+
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        # PoolManager creates its per-host pools lazily from these kwargs,
+        # so adjusting them before the first request is enough.
+        manager.connection_pool_kw["maxsize"] = self._POOL_MAXSIZE
+        return manager
+
+
+# Static Firefox configuration, built once at import and replayed onto each
+# new driver; only the user agent varies per driver.
+_FIREFOX_ARGUMENTS = (
+    # Basic options for headless browsing
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-blink-features=AutomationControlled",
+)
+
+_FIREFOX_PREFERENCES = {
+    # Ensure JavaScript is enabled
+    "javascript.enabled": True,
+    # Masking to imitate real user behavior
+    "dom.webdriver.enabled": False,
+    # Reduce delays during page loads
+    "permissions.default.image": 2,
+    "dom.ipc.plugins.enabled.libflashplayer.so": False,
+    # Disable web notifications
+    "dom.webnotifications.enabled": False,
+    # Disable media
+    "media.volume_scale": "0.0",
+    # Disable auto-updates
+    "app.update.auto": False,
+    "app.update.enabled": False,
+}
+
+# Class/id substrings that mark ads, banners, navigation and similar noise.
+# Interned so any Python-level comparisons against them are pointer checks.
+_UNWANTED_PATTERNS = frozenset(
+    map(
+        sys.intern,
+        {
+            "ads",
+            "advertisement",
+            "cookie",
+            "cookies",
+            "cookie-banner",
+            "branda-cookie-notice",
+            "banner",
+            "widget",
+            "notice",
+            "cookie-notice",
+            "footer",
+            "subs",
+            "header",
+            "sidemenu",
+            "sidebar",
+            "bar",
+            "menu",
+            "navbar",
+            "nav",
+            "navigation",
+            "tracker",
+            "tracking",
+            "promo",
+            "promotion",
+            "sponsor",
+            "sponsored",
+            "ad-slot",
+            "ad-wrapper",
+            "ad-container",
+            "adbox",
+            "popup",
+            "pop-up",
+            "social",
+            "share",
+            "sharing",
+            "comments",
+            "disqus",
+            "fb",
+            "twitter",
+            "instagram",
+            "widgetbox",
+            "login",
+            "signup",
+            "subscribe",
+            "related",
+            "gallery",
+            "breadcrumb",
+            "bottom",
+            "label",
+            "modal-content",
+        },
+    )
+)
+
+# Tags removed wholesale regardless of attributes.
+_DIRECT_TAGS_TO_REMOVE = frozenset(
+    map(
+        sys.intern,
+        {
+            "header",
+            "footer",
+            "nav",
+            "script",
+            "style",
+            "form",
+            "button",
+            "iframe",
+        },
+    )
+)
+
+# One compiled scan per class/id value instead of one substring check per
+# pattern at the Python level.
+_UNWANTED_ATTR_RE = re.compile("|".join(map(re.escape, sorted(_UNWANTED_PATTERNS))))
+
+# Tags whose text is collected as paragraph content.
+_PARAGRAPH_TAGS = frozenset({"p", "span"})
+
+
+class _ParagraphTarget:
+    """
+    lxml target parser that collects paragraph text in one streaming pass.
+
+    Unwanted subtrees (direct tags and elements whose class/id matches an
+    unwanted pattern) are skipped as their events stream by, so the page
+    never materializes as a DOM: peak memory is bounded by the collected
+    text instead of the document size, and removal and extraction no
+    longer need separate tree traversals.
+    """
+
+    def __init__(self) -> None:
+        self._skip_depth = 0
+        self._paragraph_depth = 0
+        self._current: list = []
+        self._paragraphs: list = []
+        self._all_text: list = []
+
+    def start(self, tag: str, attrib) -> None:
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+
+        if tag in _DIRECT_TAGS_TO_REMOVE or self._is_unwanted(attrib):
+            self._skip_depth = 1
+            return
+
+        if tag in _PARAGRAPH_TAGS:
+            self._paragraph_depth += 1
+
+    def end(self, tag: str) -> None:
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+
+        if tag in _PARAGRAPH_TAGS and self._paragraph_depth:
+            self._paragraph_depth -= 1
+
+            if not self._paragraph_depth:
+                self._flush_paragraph()
+
+    def data(self, text: str) -> None:
+        if self._skip_depth:
+            return
+
+        self._all_text.append(text)
+
+        if self._paragraph_depth:
+            self._current.append(text)
+
+    def close(self) -> "_ParagraphTarget":
+        self._flush_paragraph()
+        return self
+
+    @staticmethod
+    def _is_unwanted(attrib) -> bool:
+        for attr in ("class", "id"):
+            value = attrib.get(attr)
+            if value and _UNWANTED_ATTR_RE.search(value):
+                return True
+
+        return False
+
+    def _flush_paragraph(self) -> None:
+        if self._current:
+            paragraph = "".join(self._current).strip()
+            self._current.clear()
+
+            if paragraph:
+                self._paragraphs.append(paragraph)
+
+    def paragraph_text(self) -> str:
+        return "\n".join(self._paragraphs)
+
+    def body_text(self) -> str:
+        return "".join(self._all_text).strip()
+
+# Resolves as soon as document.readyState reaches "complete": one WebDriver
+# round trip instead of WebDriverWait's 500 ms polling (up to 20 round trips).
+_WAIT_FOR_COMPLETE_SCRIPT = (
+    "var callback = arguments[arguments.length - 1];"
+    "if (document.readyState === 'complete') { callback(); return; }"
+    "document.addEventListener('readystatechange', function () {"
+    "    if (document.readyState === 'complete') { callback(); }"
+    "});"
+)
+
+# With the eager load strategy driver.get already returned on
+# DOMContentLoaded, so full readiness only gets a short extra budget.
+_READYSTATE_BUDGET = 2
+
+# Retry policy for transient WebDriver errors.
+_MAX_RETRIES = 3
+_BACKOFF_BASE = 0.5
+_BACKOFF_JITTER = 0.5
+
+# Scrape results are kept this long before a URL is fetched again.
+_CACHE_TTL = 300
+# Upper bound on cached URLs; the least recently used entry is evicted first.
+_CACHE_MAX_ENTRIES = 1024
 
 
 class SelenoidWebScraper:
+    # Shared across instances so every request handler hits the same cache.
+    _cache: ClassVar["OrderedDict[str, asyncio.Future]"] = OrderedDict()
+    _cache_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
     def __init__(
         self,
-        user_agents: List[str] = _USER_AGENTS,
+        user_agents: Tuple[str, ...] = _USER_AGENTS,
         command_executor: str = SELENOID_COMMAND_EXECUTOR,
     ) -> None:
         """
@@ -40,58 +294,62 @@ class SelenoidWebScraper:
 
         self.USER_AGENTS = user_agents
         self.command_executor = command_executor
+        # Instance-local RNG so user-agent picks do not contend on the
+        # global random lock.
+        self._rng = random.Random()
 
-    def _create_firefox_driver(self) -> webdriver.Remote:
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _base_firefox_options(cls) -> webdriver.FirefoxOptions:
         """
-        Creates an instance of the Firefox web driver with the specified settings.
+        Build the Firefox options template shared by every driver.
 
-        :return: Returns an instance of the remote Firefox web driver.
-        """
+        Constructed once and cached; callers clone it and patch the
+        per-driver user agent.
 
+        :return: Fully configured Firefox options.
+        """
         firefox_options = webdriver.FirefoxOptions()
 
-        # Basic options for headless browsing
-        firefox_options.add_argument("--headless")
-        firefox_options.add_argument("--no-sandbox")
-        firefox_options.add_argument("--disable-dev-shm-usage")
-        firefox_options.add_argument("--disable-gpu")
-        firefox_options.add_argument("--disable-blink-features=AutomationControlled")
+        for argument in _FIREFOX_ARGUMENTS:
+            firefox_options.add_argument(argument)
 
-        # Ensure JavaScript is enabled
-        firefox_options.set_preference("javascript.enabled", True)
+        for preference, value in _FIREFOX_PREFERENCES.items():
+            firefox_options.set_preference(preference, value)
 
-        # Masking to imitate real user behavior
-        firefox_options.set_preference("dom.webdriver.enabled", False)
-        user_agent = self.get_random_user_agent()
-        firefox_options.set_preference("general.useragent.override", user_agent)
+        firefox_options.set_capability("browserName", "firefox")
+        # Return from driver.get on DOMContentLoaded instead of waiting for
+        # every subresource; images are disabled already and text extraction
+        # does not need CSS or fonts.
+        firefox_options.set_capability("pageLoadStrategy", "eager")
 
-        # Reduce delays during page loads
-        firefox_options.set_preference("permissions.default.image", 2)
-        firefox_options.set_preference(
-            "dom.ipc.plugins.enabled.libflashplayer.so", False
-        )
+        # Keep geckodriver quiet; its trace log grows with every command.
+        firefox_options.log.level = "fatal"
 
-        # Disable web notifications
-        firefox_options.set_preference("dom.webnotifications.enabled", False)
+        return firefox_options
 
-        # Disable media
-        firefox_options.set_preference("media.volume_scale", "0.0")
+    def _create_firefox_driver(self) -> webdriver.Remote:
+        """
+        Creates an instance of the Firefox web driver with the specified settings.
 
-        # Disable auto-updates
-        firefox_options.set_preference("app.update.auto", False)
-        firefox_options.set_preference("app.update.enabled", False)
+        :return: Returns an instance of the remote Firefox web driver.
+        """
 
-        capabilities = {
-            "browserName": "firefox",
-        }
-        firefox_options.to_capabilities().update(capabilities)
+        # Clone the cached template; only the user agent differs between drivers.
+        firefox_options = copy.deepcopy(self._base_firefox_options())
+        firefox_options.set_preference(
+            "general.useragent.override", self.get_random_user_agent()
+        )
 
         return webdriver.Remote(
-            command_executor=self.command_executor, options=firefox_options
+            command_executor=_PooledRemoteConnection(
+                self.command_executor, keep_alive=True
+            ),
+            options=firefox_options,
         )
 
     @staticmethod
-    def _imitate_user_behavior(driver: webdriver.Remote) -> None:
+    async def _imitate_user_behavior(driver: webdriver.Remote) -> None:
         """
         Imitate real user behavior to avoid bot detection.
 
@@ -109,56 +367,73 @@ class SelenoidWebScraper:
             # Add more actions here
         ]
 
-        for action in random.sample(actions, len(actions)):
-            action()
-            time.sleep(random.uniform(0.5, 2.5))
+        random.shuffle(actions)
+
+        for action in actions:
+            await asyncio.to_thread(action)
+            await asyncio.sleep(random.uniform(0.5, 2.5))
 
-    def _safe_get(self, driver, method: Callable[..., Any], *args, **kwargs) -> bool:
+    async def _safe_get(
+        self, driver, method: Callable[..., Any], *args, **kwargs
+    ) -> bool:
         """
         Safely execute a function or method, catching specific Selenium exceptions.
 
+        Transient errors are retried on the same driver with exponential
+        backoff plus jitter; a dead session is reported to the pool for
+        recycling instead of being retried.
+
         :param driver: Current instance of the web driver.
         :param method: The function or method to execute.
         :param args: Positional arguments to pass to the action.
         :param kwargs: Keyword arguments to pass to the action.
-        :return: The result of the executed action, or None if an exception occurs.
+        :return: True if the action succeeded, False otherwise.
         """
-        retries = 0
         last_exception = None
 
-        while retries < 3:
+        for attempt in range(_MAX_RETRIES):
             try:
-                method(*args, **kwargs)
+                await asyncio.to_thread(method, *args, **kwargs)
                 return True
 
-            except (
-                TimeoutException,
-                WebDriverException,
-                InvalidSessionIdException,
-            ) as ex:
-                retries += 1
+            except InvalidSessionIdException as ex:
+                # The session is gone; no retry on this driver can succeed.
+                get_pool().mark_broken(driver)
+                print(f"Driver session lost in _safe_get: {ex}")
+                return False
+
+            except (TimeoutException, WebDriverException) as ex:
                 last_exception = ex
 
-                if retries < 3:
-                    self.stop(driver)  # Close the current driver
-                    driver = self.start()  # Start a new driver
+                if attempt < _MAX_RETRIES - 1:
+                    backoff = _BACKOFF_BASE * 2**attempt + self._rng.uniform(
+                        0, _BACKOFF_JITTER
+                    )
+                    await asyncio.sleep(backoff)
 
         print(f"Max retries reached. Last error in _safe_get: {last_exception}")
         return False
 
-    def start(self) -> webdriver.Remote:
+    async def start(self) -> webdriver.Remote:
         """
         Start the browser driver.
         Initializes the web driver instance for the scraper.
         """
-        driver = self._create_firefox_driver()
+        driver = await asyncio.to_thread(self._create_firefox_driver)
 
-        driver.set_page_load_timeout(20)
+        await asyncio.to_thread(driver.set_page_load_timeout, PAGE_LOAD_TIMEOUT)
+        await asyncio.to_thread(driver.set_script_timeout, _READYSTATE_BUDGET)
 
-        driver.execute_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        await asyncio.to_thread(
+            driver.execute_script,
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
         )
-        self._imitate_user_behavior(driver=driver)
+        # Several seconds of scroll-and-sleep per driver; with pooled
+        # drivers this only runs at warm-up and recycle, and for headless
+        # scraping of known sites it is usually pure latency.
+        if IMITATE_USER:
+            await self._imitate_user_behavior(driver=driver)
+
         return driver
 
     @staticmethod
@@ -174,164 +449,159 @@ class SelenoidWebScraper:
         except (WebDriverException, InvalidSessionIdException):
             print("Browser session was not found. It might have been closed already.")
 
-    def _fetch_url(self, url: str) -> Optional[str]:
+    async def _fetch_url(self, url: str) -> Optional[str]:
         """
-        Fetch the source content of the given URL using a Firefox web driver.
+        Fetch the source content of the given URL using a pooled Firefox web driver.
 
         :param url: The URL to be fetched.
         :return: The page source if fetched successfully, else None.
         """
-        driver = self.start()
-
-        try:
-            if not self._safe_get(driver, driver.get, url):
-                return "This site is not responding."
-
-            WebDriverWait(driver, 10).until(
-                lambda x: x.execute_script("return document.readyState") == "complete"
-            )
-            return driver.page_source
-
-        except TimeoutException as e:
-            print(
-                f"TimeoutException in WebDriverWait, web site not loaded full: {url}: {e}"
-            )
-            return "This site is not responding."
-
-        except WebDriverException as e:
-            print(f"Error fetching page source from {url}: {e}")
-            return None
-
-        finally:
-            self.stop(driver)
+        async with get_pool().acquire() as driver:
+            try:
+                if not await self._safe_get(driver, driver.get, url):
+                    return "This site is not responding."
+
+                try:
+                    await asyncio.to_thread(
+                        driver.execute_async_script, _WAIT_FOR_COMPLETE_SCRIPT
+                    )
+                except TimeoutException as e:
+                    # Under the eager strategy the DOM is already
+                    # interactive; straggling subresources are not worth
+                    # failing the scrape over.
+                    print(
+                        f"readyState did not reach complete within budget: {url}: {e}"
+                    )
+
+                return await asyncio.to_thread(getattr, driver, "page_source")
+
+            except WebDriverException as e:
+                print(f"Error fetching page source from {url}: {e}")
+                return None
 
     def get_random_user_agent(self) -> str:
         """
         Return a randomly selected user agent.
         """
-        return random.choice(self.USER_AGENTS)
+        return self._rng.choice(self.USER_AGENTS)
 
     @staticmethod
-    def _extract_text_from_paragraphs(paragraphs: Iterable[Tag]) -> str:
+    def _body_region(page_source: str) -> str:
         """
-        Extract and join the text from a list of paragraph elements.
+        Cut the page source down to its `<body>` region.
 
-        :param paragraphs: Iterable of paragraph elements.
-        :return: Extracted text combined into a single string.
-        """
-        return "\n".join(p.get_text().strip() for p in paragraphs)
+        Only the body is ever queried, so excluding `<head>` (scripts,
+        styles, meta) from the parse saves time and memory proportional to
+        its size. The slice is re-wrapped in `<html>` so lxml keeps the
+        body element in the parsed tree.
 
-    @staticmethod
-    def _remove_unwanted_elements(soup: BeautifulSoup) -> None:
+        :param page_source: The HTML content of a page.
+        :return: The body region, or the full source if no body tag is found.
         """
-        Remove elements that are likely advertisements, cookie notifications, or specific tags.
+        lowered = page_source.lower()
+        start = lowered.find("<body")
 
-        :param soup: BeautifulSoup object containing the HTML content.
-        """
-        unwanted_patterns = {
-            "ads",
-            "advertisement",
-            "cookie",
-            "cookies",
-            "cookie-banner",
-            "branda-cookie-notice",
-            "banner",
-            "widget",
-            "notice",
-            "cookie-notice",
-            "footer",
-            "subs",
-            "header",
-            "sidemenu",
-            "sidebar",
-            "bar",
-            "menu",
-            "navbar",
-            "nav",
-            "navigation",
-            "tracker",
-            "tracking",
-            "promo",
-            "promotion",
-            "sponsor",
-            "sponsored",
-            "ad-slot",
-            "ad-wrapper",
-            "ad-container",
-            "adbox",
-            "popup",
-            "pop-up",
-            "social",
-            "share",
-            "sharing",
-            "comments",
-            "disqus",
-            "fb",
-            "twitter",
-            "instagram",
-            "widgetbox",
-            "login",
-            "signup",
-            "subscribe",
-            "related",
-            "gallery",
-            "breadcrumb",
-            "bottom",
-            "label",
-            "modal-content",
-        }
+        if start == -1:
+            return page_source
 
-        direct_tags_to_remove = {
-            "header",
-            "footer",
-            "nav",
-            "script",
-            "style",
-            "form",
-            "button",
-            "iframe",
-        }
+        end = lowered.rfind("</body>")
 
-        for tag in direct_tags_to_remove:
-            for element in soup.find_all(tag):
-                element.decompose()
+        if end == -1:
+            return "<html>" + page_source[start:]
 
-        for pattern in unwanted_patterns:
-            for attr in ["class", "id"]:
-                for element in soup.find_all(True, {attr: pattern}):
-                    element.decompose()
+        return "<html>" + page_source[start : end + len("</body>")] + "</html>"
 
     def _extract_paragraphs(self, page_source: Optional[str]) -> Optional[str]:
         """
         Extract paragraphs from the provided page source.
 
         This function attempts to extract paragraphs from a given page source. It
-        uses BeautifulSoup to parse the page source and then searches for paragraphs
-        using `p` and `span` tags.
+        stream-parses the page source with an lxml target parser that collects
+        the text of `p` and `span` tags and skips unwanted subtrees in a
+        single pass, without building a DOM.
 
         :param page_source: The HTML content of a page.
         :return: Extracted paragraphs joined into a single string, or None if no paragraphs were extracted.
         """
-        if not page_source:
+        # Pages this small cannot yield 1000 characters of extracted text,
+        # so skip parsing them. Return None rather than the source itself:
+        # raw markup must never be served as scrape content.
+        if not page_source or len(page_source) < 2000:
             return None
 
-        soup = BeautifulSoup(page_source, "lxml")
-        body = soup.body
+        parser = etree.HTMLParser(target=_ParagraphTarget())
 
-        if body:
-            self._remove_unwanted_elements(body)
+        try:
+            parser.feed(self._body_region(page_source))
+            target = parser.close()
+        except etree.LxmlError as e:
+            print(f"Failed to parse page source: {e}")
+            return None
 
-            all_elements = itertools.chain(body.select("p"), body.select("span"))
-            text = self._extract_text_from_paragraphs(all_elements).strip()
+        text = target.paragraph_text()
 
-            if len(text) < 1000:
-                text = body.get_text().strip()
+        # The full-body fallback is only computed when the paragraph text
+        # turned out too short.
+        if len(text) < 1000:
+            text = target.body_text()
 
-            return text
+        return text
 
-        return None
+    async def scrape(self, url: str) -> Optional[str]:
+        """
+        Scrape content from a given URL, memoizing results per URL.
+
+        Concurrent requests for the same URL share a single in-flight fetch,
+        and completed results are served from the cache for `_CACHE_TTL`
+        seconds before the URL is fetched again.
+
+        :param url: The target URL to be scraped.
+        :return: Extracted content from the given URL, or None if extraction was unsuccessful.
+        """
+        loop = asyncio.get_running_loop()
+        owner = False
 
-    def scrape(self, url: str) -> Optional[str]:
+        async with self._cache_lock:
+            future = self._cache.get(url)
+
+            if future is not None:
+                self._cache.move_to_end(url)
+            else:
+                owner = True
+                future = loop.create_future()
+                self._cache[url] = future
+
+                while len(self._cache) > _CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+
+        if not owner:
+            return await future
+
+        try:
+            result = await self._do_scrape(url)
+            future.set_result(result)
+        except Exception as ex:
+            future.set_exception(ex)
+            self._cache.pop(url, None)
+            raise
+        finally:
+            # A cancelled owner (client disconnect, shutdown) must never
+            # leave a pending future behind, or every later request for
+            # this URL would await it forever: wake the waiters and drop
+            # the entry so the next request retries.
+            if not future.done():
+                future.cancel()
+                self._cache.pop(url, None)
+
+        if result is None or result == "This site is not responding.":
+            # Do not pin failures for the whole TTL.
+            self._cache.pop(url, None)
+        else:
+            loop.call_later(_CACHE_TTL, self._cache.pop, url, None)
+
+        return result
+
+    async def _do_scrape(self, url: str) -> Optional[str]:
         """
          A worker function to scrape content from a given URL and save the result in the specified folder.
 
@@ -343,7 +613,7 @@ class SelenoidWebScraper:
          :return: Extracted content from the given URL, or None if extraction was unsuccessful.
         """
 
-        page_source = self._fetch_url(url)
+        page_source = await self._fetch_url(url)
 
         if page_source == "This site is not responding.":
             return page_source